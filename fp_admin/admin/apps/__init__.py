@@ -1,8 +1,9 @@
-from .app_info import apps_info
+from .app_info import apps_info, apps_info_json
 from .schema import AppInfo, ModelInfo
 
 __all__ = [
     "apps_info",
+    "apps_info_json",
     "ModelInfo",
     "AppInfo",
 ]
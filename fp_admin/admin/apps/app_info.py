@@ -1,39 +1,59 @@
-from typing import TYPE_CHECKING, Dict, List
+from collections import defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from pydantic import TypeAdapter
 
 from fp_admin.registry import apps_registry
-from fp_admin.settings_loader import settings
 
 from .schema import AppInfo, ModelInfo
 
 if TYPE_CHECKING:
     from fp_admin.registry.admin_model_config import AdminModelConfig
 
+_apps_adapter: TypeAdapter[Tuple[AppInfo, ...]] = TypeAdapter(Tuple[AppInfo, ...])
+
+
+def apps_info() -> Tuple[AppInfo, ...]:
+    from fp_admin.registry import model_registry
+
+    return _build_apps_info(apps_registry.version, model_registry.version)
+
+
+def apps_info_json() -> bytes:
+    """Return the apps listing serialized to JSON, cached like `apps_info`."""
+    from fp_admin.registry import model_registry
+
+    return _build_apps_info_json(apps_registry.version, model_registry.version)
+
+
+@lru_cache(maxsize=1)
+def _build_apps_info_json(apps_version: int, models_version: int) -> bytes:
+    return _apps_adapter.dump_json(_build_apps_info(apps_version, models_version))
+
+
+@lru_cache(maxsize=1)
+def _build_apps_info(_apps_version: int, _models_version: int) -> Tuple[AppInfo, ...]:
+    """Build the apps listing for the given registries state.
 
-def apps_info() -> List[AppInfo]:
-    apps = []
+    The registry versions are only used as the cache key: any registration
+    bumps one of them and the listing gets rebuilt on the next call.
+    """
     from fp_admin.registry import model_registry
 
     models: Dict[str, "AdminModelConfig"] = model_registry.list() or {}
-    for app, config in apps_registry.list().items():
-        apps.append(app_info(app, config.verbose_name, models))
-    return apps
-
-
-def app_info(
-    app: str, app_label: str, models_info: Dict[str, "AdminModelConfig"]
-) -> AppInfo:
-    api_router_prefix = f"{settings.ADMIN_PATH}/{settings.API_VERSION}"
-    models: List["AdminModelConfig"] = [
-        model for model in models_info.values() if app == model.app
-    ]
-    app_models = []
-    for model in models:
-        model_name = model.name
-        app_models.append(
-            ModelInfo(
-                name=model_name,
-                label=model.label,
-                url=f"{api_router_prefix}/models/{model_name}",
-            )
-        )
-    return AppInfo(name=app, label=app_label, models=app_models)
+    models_by_app: Dict[str, List["AdminModelConfig"]] = defaultdict(list)
+    for model in models.values():
+        models_by_app[model.app].append(model)
+    return tuple(
+        app_info(app, config.verbose_name, models_by_app.get(app, []))
+        for app, config in apps_registry.list().items()
+    )
+
+
+def app_info(app: str, app_label: str, app_models: List["AdminModelConfig"]) -> AppInfo:
+    models_info = tuple(
+        ModelInfo(name=model.name, label=model.label, url=model.url)
+        for model in app_models
+    )
+    return AppInfo(name=app, label=app_label, models=models_info)
@@ -1,15 +1,19 @@
-from typing import List
+from typing import Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ModelInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     label: str
     url: str
 
 
 class AppInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     label: str
-    models: List[ModelInfo]
+    models: Tuple[ModelInfo, ...]
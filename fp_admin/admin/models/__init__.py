@@ -4,6 +4,6 @@ Models package for fp-admin.
 This package contains all data models and related functionality.
 """
 
-from .helpers import get_pk_names
+from .helpers import get_pk_names, get_relationship_load_options
 
-__all__ = ["get_pk_names"]
+__all__ = ["get_pk_names", "get_relationship_load_options"]
@@ -1,6 +1,8 @@
-from typing import List, Type
+from functools import lru_cache
+from typing import Any, List, Tuple, Type
 
 from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import SQLModel
 
 from fp_admin.exceptions import ModelError
@@ -13,15 +15,47 @@ def get_model_relationship_fields(model_class: Type[SQLModel]) -> List[str]:
     Raises:
         ModelError: If inspection fails
     """
+    return list(_get_relationship_names(model_class))
+
+
+@lru_cache(maxsize=None)
+def _get_relationship_names(model_class: Type[SQLModel]) -> Tuple[str, ...]:
+    # A mapped class's relationships are fixed, so inspect it only once
     mapper = inspect(model_class)
     if not mapper:
         raise ModelError("Failed to inspect model class.")
-    return list(mapper.relationships.keys())
+    return tuple(mapper.relationships.keys())
+
+
+@lru_cache(maxsize=None)
+def get_pk_names(model_cls: Type[SQLModel]) -> Tuple[str, ...]:
+    table = getattr(model_cls, "__table__", None)
+    if table is None:
+        return ()
+    return tuple(col.name for col in table.primary_key.columns)
+
+
+def get_relationship_load_options(
+    model_class: Type[SQLModel], relationship_fields: List[str]
+) -> List[Any]:
+    """
+    Returns eager-loading options for the given relationships.
 
+    Collections use `selectinload` (one extra `IN` query) so joining them does
+    not multiply the parent rows; scalar relationships are joined.
 
-def get_pk_names(model_cls: Type[SQLModel]) -> list[str]:
-    if not hasattr(model_cls, "__table__"):
-        return []
+    Raises:
+        ModelError: If inspection fails
+    """
+    mapper = inspect(model_class)
+    if not mapper:
+        raise ModelError("Failed to inspect model class.")
+    relationships = mapper.relationships
     return [
-        name for name, col in model_cls.__table__.columns.items() if col.primary_key
+        (
+            selectinload(getattr(model_class, name))
+            if relationships[name].uselist
+            else joinedload(getattr(model_class, name))
+        )
+        for name in relationship_fields
     ]
@@ -7,9 +7,29 @@ This module provides standardized error response formatting
 from typing import Any, Dict, List
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
 from fp_admin.models.views.exceptions import FieldErrorDetail
 
+_field_errors_adapter = TypeAdapter(List[FieldErrorDetail])
+
+# Constant part of each RFC 7807 envelope; builders only add the detail.
+_MODEL_ERROR = {
+    "type": "https://fp-admin.com/errors/model-operation",
+    "title": "Model Operation Error",
+    "status": 400,
+}
+_NOT_FOUND_ERROR = {
+    "type": "https://fp-admin.com/errors/not-found",
+    "title": "Resource Not Found",
+    "status": 404,
+}
+_SERVER_ERROR = {
+    "type": "https://fp-admin.com/errors/server-error",
+    "title": "Internal Server Error",
+    "status": 500,
+}
+
 
 def handle_validation_error(errors: List[FieldErrorDetail]) -> HTTPException:
     """
@@ -25,7 +45,7 @@ def handle_validation_error(errors: List[FieldErrorDetail]) -> HTTPException:
         "type": "https://fp-admin.com/errors/field-validation",
         "title": "Field Validation Error",
         "status": 400,
-        "errors": [err.model_dump() for err in errors],
+        "errors": _field_errors_adapter.dump_python(errors),
     }
     return HTTPException(status_code=400, detail=error_response)
 
@@ -44,12 +64,7 @@ class ErrorResponseBuilder:
         Returns:
             RFC 7807 compliant error response
         """
-        return {
-            "type": "https://fp-admin.com/errors/model-operation",
-            "title": "Model Operation Error",
-            "status": 400,
-            "detail": message,
-        }
+        return {**_MODEL_ERROR, "detail": message}
 
     @staticmethod
     def not_found_error(resource: str, identifier: str) -> Dict[str, Any]:
@@ -64,9 +79,7 @@ class ErrorResponseBuilder:
             RFC 7807 compliant error response
         """
         return {
-            "type": "https://fp-admin.com/errors/not-found",
-            "title": "Resource Not Found",
-            "status": 404,
+            **_NOT_FOUND_ERROR,
             "errors": f"{resource.capitalize()} '{identifier}' not found",
         }
 
@@ -81,12 +94,7 @@ class ErrorResponseBuilder:
         Returns:
             RFC 7807 compliant error response
         """
-        return {
-            "type": "https://fp-admin.com/errors/server-error",
-            "title": "Internal Server Error",
-            "status": 500,
-            "detail": message,
-        }
+        return {**_SERVER_ERROR, "detail": message}
 
 
 def handle_record_error(message: str) -> HTTPException:
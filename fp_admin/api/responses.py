@@ -0,0 +1,22 @@
+"""
+Response classes for fp-admin API.
+
+This module provides response classes used by the API endpoints.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response serialized by pydantic-core.
+
+    Returning it from an endpoint skips FastAPI's response_model validation
+    and jsonable_encoder pass; datetimes, UUIDs and decimals are handled by
+    the serializer itself.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -1,12 +1,12 @@
 from typing import List
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from fp_admin.admin.apps import AppInfo, apps_info
+from fp_admin.admin.apps import AppInfo, apps_info_json
 
 apps_api = APIRouter()
 
 
-@apps_api.get("/")
-def list_apps() -> List[AppInfo]:
-    return apps_info()
+@apps_api.get("/", response_model=List[AppInfo])
+async def list_apps() -> Response:
+    return Response(content=apps_info_json(), media_type="application/json")
@@ -1,6 +1,7 @@
-from typing import Any, Dict, Optional, Type
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Optional, Sequence, Tuple, Type
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -9,6 +10,7 @@ from fp_admin.api.error_handlers import (
     handle_record_error,
     handle_validation_error,
 )
+from fp_admin.api.responses import PydanticJSONResponse
 from fp_admin.api.v1.schemas.models import (
     ModelRecordByIdResponseSchema,
     ModelRecordsResponseSchema,
@@ -23,6 +25,16 @@ from fp_admin.services.v1 import CreateService, ListService, ReadService, Update
 models_api = APIRouter()
 
 
+@lru_cache(maxsize=512)
+def _split_fields(fields: str) -> Tuple[str, ...]:
+    return tuple(f.strip() for f in fields.split(","))
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Sequence[str]]:
+    """Parse the comma-separated `fields` query parameter."""
+    return _split_fields(fields) if fields else None
+
+
 def get_model_class(model_name: str) -> Type[SQLModel]:
     model_info = model_registry.get(model_name)
     if not model_info:
@@ -40,7 +52,7 @@ async def create_record(
     model_name: str,
     params: CreateRecordParams,
     session: AsyncSession = Depends(get_session),
-) -> ModelRecordByIdResponseSchema:
+) -> Response:
     """Create a new record for a model."""
     # if not request.form_id:
     #     raise handle_validation_error()
@@ -50,7 +62,7 @@ async def create_record(
         created_record: Dict[str, Any] = await service.create_record(
             session, params, True
         )  # type: ignore
-        return ModelRecordByIdResponseSchema(data=created_record)
+        return PydanticJSONResponse({"data": created_record})
     except FpValidationErrors as e:
         raise handle_validation_error(e.details) from e
     except Exception as e:
@@ -68,14 +80,14 @@ async def create_record(
 async def items(
     model_name: str,
     session: AsyncSession = Depends(get_session),
-    page: int = 1,
-    page_size: int = 20,
+    page: Annotated[int, Query(ge=1)] = 1,
+    page_size: Annotated[int, Query(ge=1)] = 20,
     fields: Optional[str] = None,
-) -> ModelRecordsResponseSchema:
+) -> Response:
     """Get paginated records for a model."""
 
     # Parse fields parameter
-    field_list = [f.strip() for f in fields.split(",")] if fields else None
+    field_list = parse_fields(fields)
 
     params = GetRecordsParams(
         page=page,
@@ -88,16 +100,8 @@ async def items(
 
     result = await service.list(session, params)
 
-    # Convert to our schema format
-    return ModelRecordsResponseSchema(
-        data=result.data,
-        total=result.total,
-        page=result.page,
-        page_size=result.page_size,
-        total_pages=result.total_pages,
-        has_next=result.has_next,
-        has_prev=result.has_prev,
-    )
+    # PaginatedResponse has the same fields as ModelRecordsResponseSchema
+    return PydanticJSONResponse(result)
 
 
 @models_api.get(
@@ -111,11 +115,11 @@ async def get_record_by_id(
     record_id: int,
     session: AsyncSession = Depends(get_session),
     fields: Optional[str] = None,
-) -> ModelRecordByIdResponseSchema:
+) -> Response:
     """Get a single record by ID."""
 
     # Parse fields parameter
-    field_list = [f.strip() for f in fields.split(",")] if fields else None
+    field_list = parse_fields(fields)
     model_class = get_model_class(model_name)
     service = ReadService(model_class, model_name)
 
@@ -131,7 +135,7 @@ async def get_record_by_id(
         raise handle_record_error(
             f"Failed to get {model_name} record {record_id}: {str(e)}"
         ) from e
-    return ModelRecordByIdResponseSchema(data=record)  # type: ignore
+    return PydanticJSONResponse({"data": record})
 
 
 @models_api.put(
@@ -145,7 +149,7 @@ async def update_record(
     record_id: int,
     request: UpdateRecordParams,
     session: AsyncSession = Depends(get_session),
-) -> ModelRecordByIdResponseSchema:
+) -> Response:
     """Update an existing record by ID."""
     params = UpdateRecordParams(data=request.data, form_id=request.form_id)
     model_class = get_model_class(model_name)
@@ -153,7 +157,7 @@ async def update_record(
 
     try:
         updated_record = await service.update_record(session, record_id, params)
-        return ModelRecordByIdResponseSchema(data=updated_record)
+        return PydanticJSONResponse({"data": updated_record})
     except FpValidationErrors as e:
         raise handle_validation_error(e.details) from e
     except NotFoundError as e:
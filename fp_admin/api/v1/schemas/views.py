@@ -80,11 +80,10 @@ class BaseViewSchema(BaseModel):
     @classmethod
     def serialize_view(cls, view: "BaseView") -> "BaseViewInstanceSchema":
         """Serialize a view object to the appropriate schema based on its type."""
-        if view.view_type == "form":
-            return FormViewSchema.model_validate(view)
-        if view.view_type == "list":
-            return ListViewSchema.model_validate(view)
-        raise ViewError("view type not supported")
+        schema = _VIEW_SCHEMAS.get(view.view_type)
+        if schema is None:
+            raise ViewError("view type not supported")
+        return schema.model_validate(view)
 
 
 class FormViewSchema(BaseViewSchema):
@@ -101,6 +100,12 @@ class ListViewSchema(BaseViewSchema):
     view_type: Literal["list"] = "list"
 
 
+_VIEW_SCHEMAS: Dict[str, Type[BaseViewInstanceSchema]] = {
+    "form": FormViewSchema,
+    "list": ListViewSchema,
+}
+
+
 class ViewsResponseSchema(BaseModel):
     """Schema for the response of all views endpoint."""
 
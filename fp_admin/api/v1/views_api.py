@@ -1,6 +1,7 @@
+from functools import lru_cache
 from typing import Dict, List
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from fp_admin.api.v1.schemas.views import (
     BaseViewInstanceSchema,
@@ -20,16 +21,11 @@ views_api = APIRouter()
     summary="Get all views",
     description="Retrieve all registered views organized by model name",
 )
-def get_views() -> ViewsResponseSchema:
+async def get_views() -> Response:
     """Get all registered views."""
-    views_data = view_registry.list()
-    # Convert BaseView objects to appropriate schema for proper serialization
-    serialized_views: Dict[str, List[BaseViewInstanceSchema]] = {}
-    for model_name, views in views_data.items():
-        serialized_views[model_name] = [
-            BaseViewSchema.serialize_view(view) for view in views
-        ]
-    return ViewsResponseSchema(data=serialized_views)
+    return Response(
+        content=_views_json(view_registry.version), media_type="application/json"
+    )
 
 
 @views_api.get(
@@ -39,11 +35,39 @@ def get_views() -> ViewsResponseSchema:
     summary="Get model views",
     description="Retrieve all views for a specific model",
 )
-async def get_model_views(model_name: str) -> ModelViewsResponseSchema:
+async def get_model_views(model_name: str) -> Response:
     """Get views for a specific model."""
+    return Response(
+        content=_model_views_json(model_name, view_registry.version),
+        media_type="application/json",
+    )
+
+
+# Views only change when one is registered, which bumps the registry
+# version: the serialized bodies are cached per version.
+@lru_cache(maxsize=1)
+def _views_json(_version: int) -> bytes:
+    views_data = view_registry.list()
+    # Convert BaseView objects to appropriate schema for proper serialization
+    serialized_views: Dict[str, List[BaseViewInstanceSchema]] = {}
+    for model_name, views in views_data.items():
+        serialized_views[model_name] = [
+            BaseViewSchema.serialize_view(view) for view in views
+        ]
+    return (
+        ViewsResponseSchema(data=serialized_views)
+        .model_dump_json(exclude_none=True)
+        .encode()
+    )
+
+
+@lru_cache(maxsize=128)
+def _model_views_json(model_name: str, _version: int) -> bytes:
     views_data = view_registry.get(model_name)
     if not views_data:
         views = []
     else:
         views = [BaseViewSchema.serialize_view(view) for view in views_data]
-    return ModelViewsResponseSchema(data=views)
+    return (
+        ModelViewsResponseSchema(data=views).model_dump_json(exclude_none=True).encode()
+    )
@@ -4,14 +4,16 @@ from typing import List, Optional
 
 from sqlmodel import Field, Relationship, SQLModel
 
+from fp_admin.models.field.constants import EMAIL_PATTERN
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
 
 class TimestampedModel(SQLModel):
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC), nullable=False
-    )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC), nullable=False
-    )
+    created_at: datetime = Field(default_factory=_utcnow, nullable=False)
+    updated_at: datetime = Field(default_factory=_utcnow, nullable=False)
 
 
 class GenderEnum(str, Enum):
@@ -21,19 +23,25 @@ class GenderEnum(str, Enum):
     PREFER_NOT_TO_SAY = "PREFER_NOT_TO_SAY"
 
 
+# The composite primary key indexes link rows by their first column only;
+# the second one gets its own index for the reverse side of the relationship.
 class UserGroupLink(SQLModel, table=True, tablename="user_group_link"):
     user_id: int = Field(foreign_key="user.id", primary_key=True)
-    group_id: int = Field(foreign_key="group.id", primary_key=True)
+    group_id: int = Field(foreign_key="group.id", primary_key=True, index=True)
 
 
 class GroupPermissionLink(SQLModel, table=True, table_name="group_permission"):
     group_id: int = Field(foreign_key="group.id", primary_key=True)
-    permission_id: int = Field(foreign_key="permission.id", primary_key=True)
+    permission_id: int = Field(
+        foreign_key="permission.id", primary_key=True, index=True
+    )
 
 
 class UserPermissionLink(SQLModel, table=True, table_name="user_permission"):
     user_id: int = Field(foreign_key="user.id", primary_key=True)
-    permission_id: int = Field(foreign_key="permission.id", primary_key=True)
+    permission_id: int = Field(
+        foreign_key="permission.id", primary_key=True, index=True
+    )
 
 
 class Permission(TimestampedModel, SQLModel, table=True, table_name="permission"):
@@ -70,7 +78,7 @@ class User(TimestampedModel, SQLModel, table=True, table_name="user"):
         title="Email",
         nullable=False,
         unique=True,
-        regex=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+        regex=EMAIL_PATTERN,
         max_length=255,
     )
     password: str = Field(title="Password", nullable=False)
@@ -100,8 +108,3 @@ class UserOAuthAccount(
     provider: str = Field(nullable=False, max_length=50)
     provider_user_id: str = Field(nullable=False, max_length=255)
     user: Optional[User] = Relationship(back_populates="oauth_accounts")
-
-
-User.model_rebuild()
-Group.model_rebuild()
-Permission.model_rebuild()
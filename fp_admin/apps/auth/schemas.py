@@ -19,7 +19,8 @@ class GroupRequest(BaseModel):
 class UserResponse(BaseModel):
     id: int
     username: str
-    email: EmailStr
+    # Read back from the database, where the email was validated on write
+    email: str
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     gender: GenderEnum
@@ -1,10 +1,15 @@
+import asyncio
+import logging
 from typing import Any, Dict, Optional
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
 from fastapi import HTTPException
-from passlib.context import CryptContext
+from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from fp_admin.exceptions import ServiceError
 from fp_admin.providers.exceptions import AuthError
 from fp_admin.providers.internal import InternalProvider, TokenResponse
 from fp_admin.schemas import CreateRecordParams
@@ -18,7 +23,14 @@ from .schemas import (
     UserResponse,
 )
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+password_hasher = PasswordHasher()
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    try:
+        return password_hasher.verify(hashed_password, password)
+    except (VerifyMismatchError, InvalidHashError):
+        return False
 
 
 class UserService:
@@ -31,13 +43,17 @@ class UserService:
         exists = await self.session.exec(stmt)
         if exists.first():
             raise ValueError("User already exists")
-        data.password = pwd_context.hash(data.password)
+        # argon2 is deliberately slow: keep it off the event loop
+        data.password = await asyncio.to_thread(password_hasher.hash, data.password)
         params = CreateRecordParams(data=data.model_dump(), form_id="UserForm")
         user_dict: Dict[str, Any] = await self.create_service.create_record(
             self.session, params, True
         )  # type: ignore
         user_response = UserResponse(**user_dict)
-        return SignupResponse(data=user_response, message="USER CREATED")
+        # user_response is validated above; the envelope needs no second pass
+        return SignupResponse.model_construct(
+            data=user_response, message="USER CREATED"
+        )
 
     async def get_user_by_username(self, username: str) -> Optional[User]:
         users = await self.create_service.filter(self.session, username=username)
@@ -65,10 +81,18 @@ class UserService:
     async def user_auth_func(
         self, username: str, password: str
     ) -> Optional[Dict[str, Any]]:
-        user = await self.create_service.filter(self.session, username=username)
-        if user and pwd_context.verify(password, user[0]["password"]):
-            return user[0]
-        return None
+        # The whole row is needed: it becomes the user payload of the token
+        stmt = select(User).where(User.username == username)
+        try:
+            user = (await self.session.exec(stmt)).first()
+        except SQLAlchemyError as e:
+            logging.error("Error loading user %s: %s", username, e)
+            raise ServiceError(f"Failed to load user {username}: {e}") from e
+        if user is None:
+            return None
+        verified = await asyncio.to_thread(verify_password, password, user.password)
+        # Only a successful login needs the user serialized
+        return user.model_dump() if verified else None
 
     def get_internal_provider(self) -> InternalProvider[UserResponse]:
         return InternalProvider[UserResponse](
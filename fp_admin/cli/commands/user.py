@@ -8,7 +8,7 @@ import typer
 from sqlmodel import select
 
 from fp_admin.apps.auth.schemas import SignupRequestData
-from fp_admin.apps.auth.services import pwd_context
+from fp_admin.apps.auth.services import password_hasher
 from fp_admin.core import db_manager
 
 user_app = typer.Typer(name="user", help="User management commands")
@@ -41,7 +41,7 @@ async def createsuperuser() -> None:
         typer.echo("❌ Passwords do not match.")
         raise typer.Exit(code=1)
 
-    hashed_password = pwd_context.hash(password)
+    hashed_password = password_hasher.hash(password)
 
     async with db_manager.get_session() as session:
         stmt = select(User).where(User.username == username)
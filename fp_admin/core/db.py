@@ -1,6 +1,6 @@
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, FrozenSet, Optional, Tuple
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio.engine import AsyncEngine, create_async_engine
@@ -18,27 +18,58 @@ class DatabaseManager:
 
     _engine: AsyncEngine
 
-    def __init__(self, database_url: str, echo: bool = False):
+    def __init__(
+        self,
+        database_url: str,
+        echo: bool = False,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+    ):
         """Initialize database manager.
 
         Args:
             database_url: Database connection URL
             echo: Enable SQL query logging
+            pool_size: Connections kept in the pool (driver default if None)
+            max_overflow: Connections allowed beyond pool_size
         """
         self.database_url = database_url
         self.echo = echo
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
         self._engine = self.get_session_engine()
+        # Engine URL and table names of the last successful init_db()
+        self._initialized_for: Optional[Tuple[str, FrozenSet[str]]] = None
 
     @property
     def engine(self) -> AsyncEngine:
         """Database engine instance."""
         return self._engine
 
+    @property
+    def initialized(self) -> bool:
+        """Whether init_db() already created every table known to SQLModel.
+
+        Tables of models imported after the last init_db() make this False
+        again, so the next call creates them.
+        """
+        return self._initialized_for == self._metadata_key()
+
+    def _metadata_key(self) -> Tuple[str, FrozenSet[str]]:
+        return str(self.engine.url), frozenset(SQLModel.metadata.tables)
+
     def get_session_engine(self) -> AsyncEngine:
         """Get database engine, creating it if necessary."""
         try:
             logger.info("Creating database engine for %s", self.database_url)
-            return create_async_engine(self.database_url, echo=self.echo)
+            # Only forwarded when set: pools such as sqlite's StaticPool
+            # do not accept sizing arguments.
+            pool_kwargs: Dict[str, Any] = {}
+            if self.pool_size is not None:
+                pool_kwargs["pool_size"] = self.pool_size
+            if self.max_overflow is not None:
+                pool_kwargs["max_overflow"] = self.max_overflow
+            return create_async_engine(self.database_url, echo=self.echo, **pool_kwargs)
         except Exception as e:
             logger.error("Failed to create database engine: %s", e)
             raise DatabaseError(f"Failed to create database engine: {e}") from e
@@ -60,8 +91,10 @@ class DatabaseManager:
     async def init_db(self) -> None:
         """Create all database tables."""
         try:
+            key = self._metadata_key()
             async with self.engine.begin() as conn:
                 await conn.run_sync(SQLModel.metadata.create_all)
+            self._initialized_for = key
             logger.info("Database tables created successfully")
         except SQLAlchemyError as e:
             logger.error("Failed to create database tables: %s", e)
@@ -70,7 +103,10 @@ class DatabaseManager:
 
 # # Global database manager instance
 db_manager = DatabaseManager(
-    database_url=settings.DATABASE_URL, echo=settings.DATABASE_ECHO
+    database_url=settings.DATABASE_URL,
+    echo=settings.DATABASE_ECHO,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
 )
 
 
@@ -18,6 +18,12 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./fpadmin.db"
     DEBUG: bool = True
     DATABASE_ECHO: bool = Field(default=False, description="Enable SQL query logging")
+    DATABASE_POOL_SIZE: Optional[int] = Field(
+        default=None, description="Connections kept in the database pool"
+    )
+    DATABASE_MAX_OVERFLOW: Optional[int] = Field(
+        default=None, description="Connections allowed beyond the pool size"
+    )
 
     # Security settings
     SECRET_KEY: str = Field(
@@ -1,5 +1,8 @@
+from functools import lru_cache
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Dict,
     List,
     NotRequired,
     Optional,
@@ -8,38 +11,72 @@ from typing import (
     Unpack,
 )
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pydantic.fields import FieldInfo, _FieldInfoInputs
-from sqlmodel import SQLModel
 
-from fp_admin.admin.models import get_pk_names
-
-from .constants import RELATIONSHIP_FIELD_TYPES, FieldType
+from .constants import (
+    BUILTIN_VALIDATOR_NAMES,
+    BUILTIN_VALIDATORS,
+    RELATIONSHIP_FIELD_TYPES,
+    FieldType,
+)
 from .widgets import DEFAULT_WIDGETS, WidgetType
 
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel
+
 
 class FpFieldOption(TypedDict, total=False):
     field_id: str | int
     display_field: str | None
-    model_class: Type[SQLModel]
+    model_class: Type["SQLModel"]
     choices: List[Any]
 
 
 class FpFieldError(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     code: str
     message: Optional[str] = None
 
 
+# Errors are immutable, so every field shares the builtin validators' ones.
+_BUILTIN_VALIDATOR_ERRORS = {
+    name: FpFieldError(code=name) for name in BUILTIN_VALIDATORS
+}
+
+
 class FpFieldValidator(BaseModel):
     name: str
     condition_value: Any
     error: Optional[FpFieldError] = None
 
 
+# FpField attributes taken out of the FieldInfo inputs, with their defaults.
+_FP_FIELD_DEFAULTS: Dict[str, Any] = {
+    "help_text": None,
+    "widget": None,
+    "required": False,
+    "readonly": False,
+    "disabled": False,
+    "placeholder": None,
+    "custom_validator": None,
+    "is_primary_key": False,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_field_id(model_class: Type["SQLModel"]) -> str:
+    """Primary key name(s) of a related model, computed once per model."""
+    from fp_admin.admin.models import get_pk_names
+
+    return ",".join(get_pk_names(model_class))
+
+
 class _FpFieldInfoInputs(_FieldInfoInputs):
     help_text: NotRequired[str]
     display_field: NotRequired[str]
-    model_class: NotRequired[Type[SQLModel]]
+    model_class: NotRequired[Type["SQLModel"]]
     widget: NotRequired[WidgetType]
     required: NotRequired[bool]
     readonly: NotRequired[bool]
@@ -82,7 +119,9 @@ class FpField(FieldInfo):  # pylint: disable=R0902
     )
 
     @property
-    def model_class(self) -> Type[SQLModel]:
+    def model_class(self) -> Type["SQLModel"]:
+        from sqlmodel import SQLModel
+
         return self.options.get("model_class", SQLModel) if self.options else SQLModel
 
     @property
@@ -95,15 +134,12 @@ class FpField(FieldInfo):  # pylint: disable=R0902
         field_type: FieldType,
         **kwargs: Unpack[_FpFieldInfoInputs],
     ):
-        kwargs = self._set_validators_from_kwargs(**kwargs)
-        help_text = kwargs.pop("help_text", None)
-        widget = kwargs.pop("widget", None)
-        required = kwargs.pop("required", False)
-        readonly = kwargs.pop("readonly", False)
-        disabled = kwargs.pop("disabled", False)
-        placeholder = kwargs.pop("placeholder", None)
-        custom_validator = kwargs.pop("custom_validator", None)
-        is_primary_key = kwargs.pop("is_primary_key", False)
+        self._set_validators_from_kwargs(kwargs)
+        # Split FpField's own attributes from the FieldInfo inputs in one pass
+        fp_attrs = {**_FP_FIELD_DEFAULTS}
+        for key in _FP_FIELD_DEFAULTS.keys() & kwargs.keys():
+            fp_attrs[key] = kwargs.pop(key)
+        required = fp_attrs["required"]
 
         # check RELATIONSHIP_FIELD
 
@@ -116,56 +152,48 @@ class FpField(FieldInfo):  # pylint: disable=R0902
             kwargs["annotation"] = Any
         if not kwargs.get("default") and not required:
             kwargs["default"] = None
-        options = self._get_field_options(field_type, name, **kwargs)
+        options = self._get_field_options(field_type, name, kwargs)
         super().__init__(**kwargs)
         self.name = name
-        self.help_text = help_text
+        self.help_text = fp_attrs["help_text"]
         self.field_type = field_type
-        self.widget = widget or DEFAULT_WIDGETS.get(field_type)
+        self.widget = fp_attrs["widget"] or DEFAULT_WIDGETS.get(field_type)
         self.required = required
-        self.readonly = readonly
-        self.disabled = disabled
-        self.placeholder = placeholder
+        self.readonly = fp_attrs["readonly"]
+        self.disabled = fp_attrs["disabled"]
+        self.placeholder = fp_attrs["placeholder"]
         self.options = options
-        self.custom_validator = custom_validator
-        self.is_primary_key = is_primary_key
+        self.custom_validator = fp_attrs["custom_validator"]
+        self.is_primary_key = fp_attrs["is_primary_key"]
 
-    def _set_validators_from_kwargs(
-        self, **kwargs: Unpack[_FpFieldInfoInputs]
-    ) -> _FpFieldInfoInputs:
+    def _set_validators_from_kwargs(self, kwargs: _FpFieldInfoInputs) -> None:
         validators: List[FpFieldValidator] = kwargs.pop("validators", []) or []
-        builtin_validators = [
-            "gt",
-            "ge",
-            "lt",
-            "le",
-            "multiple_of",
-            "min_length",
-            "max_length",
-            "pattern",
-        ]
         for v in validators:
-            if v.name in builtin_validators:
+            if v.name in BUILTIN_VALIDATOR_NAMES:
                 kwargs[v.name] = v.condition_value  # type: ignore
 
+        # Most fields set no constraint: skip the scan when none was passed
+        builtins = BUILTIN_VALIDATOR_NAMES.intersection(kwargs)
+        if not builtins:
+            self.validators = list(validators)
+            return
+        # Built from trusted values only, so skip pydantic validation
         self.validators = validators + [
-            FpFieldValidator(
+            FpFieldValidator.model_construct(
                 name=k,
                 condition_value=kwargs.get(k),
-                error=FpFieldError(code=k),
+                error=_BUILTIN_VALIDATOR_ERRORS[k],
             )
-            for k in builtin_validators
-            if kwargs.get(k)
+            for k in BUILTIN_VALIDATORS
+            if k in builtins and kwargs.get(k)
         ]
-        return kwargs
 
     def get_validator_by_error_code(self, error_code: str) -> FpFieldValidator | None:
         vs = self.validators or []
-        target_v = [v for v in vs if v.error and v.error.code == error_code]
-        return target_v[0] if target_v else None
+        return next((v for v in vs if v.error and v.error.code == error_code), None)
 
     def _get_field_options(
-        self, field_type: FieldType, name: str, **kwargs: Unpack[_FpFieldInfoInputs]
+        self, field_type: FieldType, name: str, kwargs: _FpFieldInfoInputs
     ) -> FpFieldOption | None:
         display_field = kwargs.pop("display_field", None)
         model_class = kwargs.pop("model_class", None)
@@ -180,7 +208,7 @@ class FpField(FieldInfo):  # pylint: disable=R0902
             options = options or {}
             options.update(
                 {
-                    "field_id": ",".join(get_pk_names(model_class)),
+                    "field_id": _get_field_id(model_class),
                     "display_field": display_field,
                     "model_class": model_class,
                 }
@@ -24,3 +24,18 @@ RELATIONSHIP_FIELD_TYPES = [
     "many_to_many",
     "one_to_one",
 ]
+
+# Validators that map onto pydantic's own FieldInfo constraints.
+BUILTIN_VALIDATORS = (
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "multiple_of",
+    "min_length",
+    "max_length",
+    "pattern",
+)
+BUILTIN_VALIDATOR_NAMES = frozenset(BUILTIN_VALIDATORS)
+
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
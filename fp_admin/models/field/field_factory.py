@@ -2,7 +2,7 @@ import datetime
 from typing import Unpack
 
 from ._fp_field import FpField, _FpFieldInfoInputs
-from .constants import FieldType
+from .constants import EMAIL_PATTERN, FieldType
 
 
 class FieldFactory:  # pylint: disable=R0904
@@ -30,7 +30,7 @@ class FieldFactory:  # pylint: disable=R0904
         return FpField(
             name=name,
             field_type="string",
-            pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+            pattern=EMAIL_PATTERN,
             annotation=str,
             **kwargs,
         )
@@ -80,26 +80,26 @@ class FieldFactory:  # pylint: disable=R0904
     @classmethod
     def toggle_field(cls, name: str, **kwargs: Unpack[_FpFieldInfoInputs]) -> FpField:
         """Create a string input field."""
-        widget = kwargs.pop("widget", "switch")
-        return cls.boolean_field(name=name, widget=widget, **kwargs)
+        kwargs.setdefault("widget", "switch")
+        return cls.boolean_field(name=name, **kwargs)
 
     @classmethod
     def chips_field(cls, name: str, **kwargs: Unpack[_FpFieldInfoInputs]) -> FpField:
         """Create a string input field."""
-        widget = kwargs.pop("widget", "chips")
-        return cls.multichoice_field(name=name, widget=widget, **kwargs)
+        kwargs.setdefault("widget", "chips")
+        return cls.multichoice_field(name=name, **kwargs)
 
     @classmethod
     def listbox_field(cls, name: str, **kwargs: Unpack[_FpFieldInfoInputs]) -> FpField:
         """Create a string input field."""
-        widget = kwargs.pop("widget", "listBox")
-        return cls.multichoice_field(name=name, widget=widget, **kwargs)
+        kwargs.setdefault("widget", "listBox")
+        return cls.multichoice_field(name=name, **kwargs)
 
     @classmethod
     def choice_field(cls, name: str, **kwargs: Unpack[_FpFieldInfoInputs]) -> FpField:
         """Create a string input field."""
-        widget = kwargs.pop("widget", "select")
-        return FpField(name=name, field_type="choice", widget=widget, **kwargs)
+        kwargs.setdefault("widget", "select")
+        return FpField(name=name, field_type="choice", **kwargs)
 
     @classmethod
     def multichoice_field(
@@ -116,8 +116,8 @@ class FieldFactory:  # pylint: disable=R0904
     @classmethod
     def image_field(cls, name: str, **kwargs: Unpack[_FpFieldInfoInputs]) -> FpField:
         """Create a string input field."""
-        widget = kwargs.pop("widget", "image")
-        return cls.file_field(name=name, widget=widget, **kwargs)
+        kwargs.setdefault("widget", "image")
+        return cls.file_field(name=name, **kwargs)
 
     @classmethod
     def json_field(cls, name: str, **kwargs: Unpack[_FpFieldInfoInputs]) -> FpField:
@@ -127,12 +127,8 @@ class FieldFactory:  # pylint: disable=R0904
     @classmethod
     def radio_field(cls, name: str, **kwargs: Unpack[_FpFieldInfoInputs]) -> FpField:
         """Create a radio field."""
-        widget = kwargs.pop("widget", "radio")
-        return cls.choice_field(
-            name=name,
-            widget=widget,
-            **kwargs,
-        )
+        kwargs.setdefault("widget", "radio")
+        return cls.choice_field(name=name, **kwargs)
 
     @classmethod
     def autocomplete_field(
@@ -1,20 +1,35 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from pydantic import BaseModel, ValidationError, create_model
-from sqlmodel import SQLModel
 
 from .exceptions import FieldErrorDetail, FpValidationErrors
 
 if TYPE_CHECKING:
+    from sqlmodel import SQLModel
+
     from fp_admin.models.field import FieldError, FpField
 
 
+def _same_items(cached: Tuple[Any, ...], current: List[Any]) -> bool:
+    return len(cached) == len(current) and all(a is b for a, b in zip(cached, current))
+
+
 @dataclass
 class BaseView:  # pylint: disable=R0902
     name: str
-    model: Type[SQLModel]
+    model: Type["SQLModel"]
     view_type: Literal["form", "list"] = "form"
     fields: List["FpField"] = field(default_factory=list)
     default_form_id: Optional[str] = None
@@ -23,10 +38,9 @@ class BaseView:  # pylint: disable=R0902
     display_fields: List[str] = field(default_factory=list)
 
     def get_field(self, name: str) -> "FpField":
-        if self.fields:
-            fds = [f for f in self.fields if f.name == name]
-            if fds:
-                return fds[0]
+        fd = next((f for f in self.fields or [] if f.name == name), None)
+        if fd is not None:
+            return fd
         raise ValidationError(f"Field {name} not found.")
 
 
@@ -34,12 +48,15 @@ class FormView(BaseView):
 
     view_type: Literal["form"] = "form"
     validate_form: Optional[Callable[[Dict[str, Any]], List["FieldError"]]] = None
+    # `fields` as they were when the cached form models were built
+    _form_models_fields: Optional[Tuple["FpField", ...]] = None
+    _form_models: Dict[Tuple[str, ...], Optional[Type[BaseModel]]]
 
     def validate_create_fields(self, data: Dict[str, Any]) -> None:
         self.validate_fields(self.creation_fields, data)
 
     def validate_fields(self, fields: List[str], data: Dict[str, Any]) -> None:
-        _FormModel = self.build_model_from_fields(fields)  # pylint: disable=C0103
+        _FormModel = self.get_form_model(fields)  # pylint: disable=C0103
         if not _FormModel:
             return None
         try:
@@ -48,6 +65,20 @@ class FormView(BaseView):
             self.raise_validation_error(e)
         return None
 
+    def get_form_model(self, model_fields: List[str]) -> Type[BaseModel] | None:
+        """Return the validation model for `model_fields`, built on first use.
+
+        The cached models are dropped when `fields` is replaced or edited.
+        """
+        cached_fields = self._form_models_fields
+        if cached_fields is None or not _same_items(cached_fields, self.fields):
+            self._form_models = {}
+            self._form_models_fields = tuple(self.fields)
+        key = tuple(model_fields)
+        if key not in self._form_models:
+            self._form_models[key] = self.build_model_from_fields(model_fields)
+        return self._form_models[key]
+
     def build_model_from_fields(
         self, model_fields: List[str]
     ) -> Type[BaseModel] | None:
@@ -94,7 +125,7 @@ class ListView(BaseView):
 
 
 class BaseViewFactory(ABC):
-    def __init__(self, model: type[SQLModel]):
+    def __init__(self, model: type["SQLModel"]):
         self.model = model
 
     def get_fields(self) -> List[Any]:
@@ -6,6 +6,7 @@ class AppRegistry(BaseRegistry["AppConfig"]):
 
     def register(self, config: "AppConfig") -> None:
         self._registry[config.name] = config
+        self._version += 1
 
 
 apps_registry = AppRegistry()
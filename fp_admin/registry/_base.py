@@ -6,6 +6,12 @@ T = TypeVar("T")
 class BaseRegistry(Generic[T]):
     def __init__(self) -> None:
         self._registry: Dict[str, T] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration, used to invalidate caches."""
+        return self._version
 
     def list(self) -> Dict[str, T]:
         return self._registry
@@ -1,9 +1,13 @@
-from typing import Any, Optional, Type
+from typing import Any, Dict, Optional, Type
 
 from sqlmodel import SQLModel
 
-from fp_admin.admin.models.helpers import get_model_relationship_fields
+from fp_admin.admin.models.helpers import (
+    get_model_relationship_fields,
+    get_pk_names,
+)
 from fp_admin.exceptions import ModelError
+from fp_admin.settings_loader import settings
 
 from ._base import BaseRegistry
 from .admin_model_config import AdminModelConfig
@@ -11,37 +15,40 @@ from .admin_model_config import AdminModelConfig
 
 class AdminModelRegistry(BaseRegistry[AdminModelConfig]):
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_model_class: Dict[Type[SQLModel], AdminModelConfig] = {}
+
     def register(self, config: "AdminModel") -> None:
         module_name = config.model.__module__
         if "." in module_name:
             app_name = module_name.split(".")[-2]
         else:
             app_name = module_name
-        columns = (
-            config.model.__table__.columns.items()
-            if hasattr(config.model, "__table__")
-            else []
-        )
-        primary_keys = [name for name, col in columns if col.primary_key]
-        self._registry[config.model.__name__.lower()] = AdminModelConfig(
+        primary_keys = list(get_pk_names(config.model))
+        model_name = config.model.__name__.lower()
+        model_config = AdminModelConfig(
             model_class=config.model,
-            name=config.model.__name__.lower(),
+            name=model_name,
             label=config.label,
             app=app_name,
             relationship_fields=get_model_relationship_fields(config.model),
             direct_fields=list(config.model.model_fields.keys()),
             display_field=config.display_field,
             primary_keys=primary_keys,
+            url=f"{settings.ADMIN_PATH}/{settings.API_VERSION}/models/{model_name}",
         )
+        previous = self._registry.get(model_name)
+        if previous is not None:
+            self._by_model_class.pop(previous.model_class, None)
+        self._registry[model_name] = model_config
+        self._by_model_class[config.model] = model_config
+        self._version += 1
 
     def get_by_model_class(self, model_class: Type[SQLModel]) -> AdminModelConfig:
-        models = [
-            model
-            for model in self._registry.values()
-            if model.model_class == model_class
-        ]
-        if models:
-            return models[0]
+        model = self._by_model_class.get(model_class)
+        if model is not None:
+            return model
         raise ModelError(f"Model [{model_class}] not found in registry")
 
 
@@ -1,4 +1,3 @@
-from itertools import chain
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, cast
 
 from sqlmodel import SQLModel
@@ -17,21 +16,24 @@ class ViewNotFound(Exception):
 
 class ViewRegistry(BaseRegistry[List[BaseView]]):
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Name indexes; the first view registered under a name wins
+        self._by_name: Dict[str, BaseView] = {}
+        self._forms_by_name: Dict[str, FormView] = {}
+
     def register(self, model: Type[SQLModel], view: BaseView) -> None:
         model_name = model.__name__.lower()
         if model_name not in self._registry:
             self._registry[model_name] = []
         self._registry[model_name].append(view)
+        self._by_name.setdefault(view.name, view)
+        if view.view_type == "form":
+            self._forms_by_name.setdefault(view.name, cast("FormView", view))
+        self._version += 1
 
     def find_by_name(self, view_name: str) -> BaseView | None:
-        target_view = [
-            v
-            for v in chain.from_iterable(self._registry.values())
-            if v.name == view_name
-        ]
-        if target_view:
-            return target_view[0]
-        return None
+        return self._by_name.get(view_name)
 
     def get_fields(
         self, model: str, view_type: Optional[str] = None
@@ -45,11 +47,10 @@ class ViewRegistry(BaseRegistry[List[BaseView]]):
 
     def get_form_view(self, form_id: str) -> FormView:
         """Get form view configuration by form ID."""
-        for _, views in self._registry.items():
-            for view in views:
-                if view.name == form_id and view.view_type == "form":
-                    return cast("FormView", view)
-        raise ViewNotFound(f"View not found: {form_id}")
+        form_view = self._forms_by_name.get(form_id)
+        if form_view is None:
+            raise ViewNotFound(f"View not found: {form_id}")
+        return form_view
 
 
 view_registry = ViewRegistry()
@@ -60,12 +61,7 @@ class ViewBuilder(BaseView):
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
         # If any key attribute is missing, call build()
-        if not all(
-            [
-                getattr(cls, "name", None),
-                getattr(cls, "fields", None),
-            ]
-        ):
+        if not (getattr(cls, "name", None) and getattr(cls, "fields", None)):
             # to refactor
             instance = cls(name=cls.name, model=cls.model, view_type=cls.view_type)
             view = instance.build()
@@ -77,27 +73,28 @@ class ViewBuilder(BaseView):
         cls._validate_field_references()
 
         # Set validate_form method on FormView if it exists in the builder
-        if hasattr(cls, "validate_form") and view.view_type == "form":
-            validate_method = getattr(cls, "validate_form")
+        validate_method = getattr(cls, "validate_form", None)
+        if validate_method is not None and isinstance(view, FormView):
 
             # Create a wrapper function to handle the method signature
             def validate_form_wrapper(form_data: Dict[str, Any]) -> List["FieldError"]:
+                # pylint: disable=E1102
                 return validate_method(cls, form_data)  # type: ignore
 
-            # Use setattr to bypass type checking
-            setattr(view, "validate_form", validate_form_wrapper)
-
-        # Set creation_fields if it exists in the builder
-        if hasattr(cls, "creation_fields") and cls.creation_fields:
-            setattr(view, "creation_fields", cls.creation_fields)
-
-        # Set allowed_update_fields if it exists in the builder
-        if hasattr(cls, "allowed_update_fields") and cls.allowed_update_fields:
-            setattr(view, "allowed_update_fields", cls.allowed_update_fields)
-
-        # Set display_fields if it exists in the builder
-        if hasattr(cls, "display_fields") and cls.display_fields:
-            setattr(view, "display_fields", cls.display_fields)
+            view.validate_form = validate_form_wrapper
+
+        # Copy the optional field lists declared on the builder, if any.
+        # They are plain dataclass fields on BaseView, not class attributes,
+        # so a builder that does not declare them has none.
+        creation_fields = getattr(cls, "creation_fields", None)
+        if creation_fields:
+            view.creation_fields = creation_fields
+        allowed_update_fields = getattr(cls, "allowed_update_fields", None)
+        if allowed_update_fields:
+            view.allowed_update_fields = allowed_update_fields
+        display_fields = getattr(cls, "display_fields", None)
+        if display_fields:
+            view.display_fields = display_fields
 
         view_registry.register(cls.model, view)
 
@@ -112,26 +109,23 @@ class ViewBuilder(BaseView):
         if not hasattr(cls, "fields") or not cls.fields:
             return  # No fields defined, skip validation
 
-        # Get the set of field names that exist in the fields list
-        existing_field_names = {field.name for field in cls.fields}
-
         # Validate creation_fields + allowed_update_fields + display_fields
-        fields = []
-        if hasattr(cls, "creation_fields") and cls.creation_fields:
-            fields.extend(cls.creation_fields)
-        if hasattr(cls, "allowed_update_fields") and cls.allowed_update_fields:
-            fields.extend(cls.allowed_update_fields)
-        if hasattr(cls, "display_fields") and cls.display_fields:
-            fields.extend(cls.display_fields)
-
-        missing_creation_fields = [
-            name for name in fields if name not in existing_field_names
-        ]
-        if missing_creation_fields:
+        referenced_fields = {
+            *(getattr(cls, "creation_fields", None) or ()),
+            *(getattr(cls, "allowed_update_fields", None) or ()),
+            *(getattr(cls, "display_fields", None) or ()),
+        }
+        if not referenced_fields:
+            return
+
+        missing_fields = referenced_fields.difference(
+            field.name for field in cls.fields
+        )
+        if missing_fields:
             raise ValueError(
                 f"model: # {cls.__name__} # "
                 f"Fields referenced fields do not exist in the "
-                "view's fields: " + f"{missing_creation_fields}"
+                "view's fields: " + f"{sorted(missing_fields)}"
             )
 
     def build(self) -> FormView | ListView:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Type
 
 from pydantic import BaseModel
 from sqlmodel import SQLModel
@@ -15,11 +15,27 @@ if TYPE_CHECKING:
 EXCLUDED_VIEW_FIELD_TYPES = {"password"}
 
 
+def _split_field_names(
+    field_names: Sequence[str], relationship_names: List[str]
+) -> Tuple[List[str], List[str]]:
+    """Split requested fields into direct and relationship ones, keeping order."""
+    requested = set(field_names)
+    target_relative_field_names = [
+        field_name for field_name in relationship_names if field_name in requested
+    ]
+    relative = set(target_relative_field_names)
+    direct_fields = [
+        field_name for field_name in field_names if field_name not in relative
+    ]
+    return direct_fields, target_relative_field_names
+
+
 class AdminModelConfig(BaseModel):
     model_class: Type[SQLModel]
     name: str
     label: str
     app: str
+    url: str
     relationship_fields: List[str]
     direct_fields: List[str]
     display_field: Optional[str] = None
@@ -29,33 +45,13 @@ class AdminModelConfig(BaseModel):
         self, field_names: List[str], form_id: str
     ) -> Tuple[List[str], List[str]]:
         relative_fields_names = self.get_view_relationship_fields_names(form_id)
-        target_relative_field_names = [
-            field_name
-            for field_name in relative_fields_names
-            if field_name in field_names
-        ]
-        direct_fields = [
-            field_name
-            for field_name in field_names
-            if field_name not in target_relative_field_names
-        ]
-        return direct_fields, target_relative_field_names
+        return _split_field_names(field_names, relative_fields_names)
 
     def get_fields_by_names(
-        self, field_names: List[str]
+        self, field_names: Sequence[str]
     ) -> Tuple[List[str], List[str]]:
         relative_fields_names = get_model_relationship_fields(self.model_class)
-        target_relative_field_names = [
-            field_name
-            for field_name in relative_fields_names
-            if field_name in field_names
-        ]
-        direct_fields = [
-            field_name
-            for field_name in field_names
-            if field_name not in target_relative_field_names
-        ]
-        return direct_fields, target_relative_field_names
+        return _split_field_names(field_names, relative_fields_names)
 
     def get_view_excluded_field_names(self) -> List[str]:
         fields = view_registry.get_fields(self.name)
@@ -5,7 +5,7 @@ This module provides base schema classes that other schemas should inherit from.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -40,7 +40,7 @@ class GetRecordsParams(BaseModel):
 
     page: int = 1
     page_size: int = 20
-    fields: Optional[List[str]] = None
+    fields: Optional[Sequence[str]] = None
     filters: Optional[List[str]] = None
     sort_by: Optional[str] = Field(default=None, description="Field to sort by")
 
@@ -74,8 +74,8 @@ class BaseService(Generic[T]):
     ) -> List[str]:
         pk_fields = get_pk_names(rel_model)
         if display_field:
-            return list(set(pk_fields + [display_field]))
-        return pk_fields
+            return list({*pk_fields, display_field})
+        return list(pk_fields)
 
     def _build_relationship_query(  # pylint: disable=R0913,R0917
         self,
@@ -84,7 +84,7 @@ class BaseService(Generic[T]):
         relationship_field: str,
         selected_fields: List[str],
         parent_ids: List[Dict[str, Any]],
-        pk_fields: List[str],
+        pk_fields: Sequence[str],
         limit_per_parent: int,
     ) -> Any:
         rel_alias = aliased(rel_model)
@@ -123,7 +123,7 @@ class BaseService(Generic[T]):
     def _map_rows_by_parent_key(
         self,
         rows: Sequence[Any],
-        pk_fields: List[str],
+        pk_fields: Sequence[str],
         selected_fields: List[str],
     ) -> Dict[Tuple[Any, ...], List[Dict[str, Any]]]:
         related_map: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = defaultdict(list)
@@ -1,10 +1,10 @@
 from typing import Any, Dict, List, TypeVar
 
 from sqlalchemy.orm.collections import InstrumentedList
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from fp_admin.admin.models import get_pk_names
+from fp_admin.admin.models import get_pk_names, get_relationship_load_options
 from fp_admin.models.field import FpField
 from fp_admin.registry import model_registry, view_registry
 from fp_admin.schemas import CreateRecordParams
@@ -130,7 +130,9 @@ class CreateService(BaseService[T]):
 
         # Load only requested relationships
         if relationship_fields:
-            await session.refresh(obj, attribute_names=relationship_fields)
+            obj = await self.reload_with_relationships(
+                session, obj, relationship_fields
+            )
 
         # Dump core fields (excluding rels)
         model_dump_kwargs: Dict[str, Any] = {}
@@ -148,6 +150,26 @@ class CreateService(BaseService[T]):
 
         return data
 
+    async def reload_with_relationships(
+        self, session: AsyncSession, obj: T, relationship_fields: List[str]
+    ) -> T:
+        """Reload `obj` with its relationships eagerly loaded in one round."""
+        stmt = (
+            select(self.model_class)
+            .where(
+                *[
+                    getattr(self.model_class, pk) == getattr(obj, pk)
+                    for pk in get_pk_names(self.model_class)
+                ]
+            )
+            .options(
+                *get_relationship_load_options(self.model_class, relationship_fields)
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await session.exec(stmt)
+        return result.one()
+
     def get_rel_instance_fields(
         self, rel_instance: InstrumentedList[SQLModel] | SQLModel
     ) -> Dict[str, Any] | List[Dict[str, Any]] | None:
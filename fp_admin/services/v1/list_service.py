@@ -56,14 +56,15 @@ class ListService(BaseService[T]):
         records_dict: List[Dict[str, Any]],
         rel_data: Dict[Tuple[Any, ...], Any],
         rel_name: str,
-        primary_keys: List[str],
+        primary_keys: Sequence[str],
     ) -> None:
+        records_by_pk = {
+            tuple(record[pk] for pk in primary_keys): record for record in records_dict
+        }
         for ids, rel_value in rel_data.items():
-            partial = dict(zip(primary_keys, ids))
-            for record in records_dict:
-                if all(record[pk] == partial[pk] for pk in primary_keys):
-                    record[rel_name] = rel_value
-                    break
+            record = records_by_pk.get(tuple(ids))
+            if record is not None:
+                record[rel_name] = rel_value
 
     async def bulk_reload(
         self,
@@ -6,7 +6,7 @@ with filtering, field selection, and pagination support.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar
 
 from sqlalchemy import func
 from sqlmodel import SQLModel, select
@@ -28,7 +28,7 @@ class QueryBuilderService:
     def build_query(
         self,
         model_class: Type[T],
-        pks: List[str],
+        pks: Sequence[str],
         filters: Optional[Dict[str, str | List[str] | List[int]]] = None,
     ) -> tuple[Any, Any]:
         """Build a query with optional filtering and field selection.
@@ -117,7 +117,7 @@ class QueryBuilderService:
         return query.offset(offset).limit(page_size)
 
     def validate_fields(
-        self, model_class: Type[T], fields: Optional[List[str]] = None
+        self, model_class: Type[T], fields: Optional[Sequence[str]] = None
     ) -> List[str]:
         """Validate that the requested fields exist in the model.
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, Dict, List, Optional, Sequence, TypeVar
 
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.attributes import InstrumentedAttribute
@@ -19,7 +19,7 @@ class ReadService(BaseService[T]):
         self,
         session: AsyncSession,
         record_id: int | str,
-        fields: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any] | T:
         """Get a single record by ID."""
 
@@ -7,7 +7,7 @@ from fastapi.testclient import TestClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from fp_admin.apps.auth.models import User
-from fp_admin.apps.auth.services import pwd_context
+from fp_admin.apps.auth.services import password_hasher
 
 pytestmark = pytest.mark.e2e
 
@@ -105,7 +105,7 @@ class TestUpdateIntegration:
     ) -> None:
         """Test signin."""
         user_password = regular_user.password
-        regular_user.password = pwd_context.hash(regular_user.password)
+        regular_user.password = password_hasher.hash(regular_user.password)
         session.add(regular_user)
         await session.commit()
         await session.refresh(regular_user)
@@ -192,6 +192,72 @@ class TestPostCRUD:
         # Note: DELETE operations are not implemented in the models API
         # The models API only supports GET, POST, and PUT operations
 
+    def test_post_create_serializes_relationships(
+        self, client: TestClient, sample_post, tech_category, python_tag
+    ) -> None:
+        """Test created post returns its scalar and collection relationships."""
+        user_data = {
+            "data": {
+                "username": "relationship_author",
+                "email": "relationship@example.com",
+                "password": "password123",
+                "is_active": True,
+                "is_superuser": False,
+            }
+        }
+        user_response = client.post("/api/v1/models/user", json=user_data)
+        assert user_response.status_code == 200
+        user_id = user_response.json()["data"]["id"]
+
+        category_data = {
+            "data": {
+                "name": tech_category.name,
+                "slug": tech_category.slug,
+                "description": tech_category.description,
+                "is_active": tech_category.is_active,
+            }
+        }
+        category_response = client.post("/api/v1/models/category", json=category_data)
+        assert category_response.status_code == 200
+        category_id = category_response.json()["data"]["id"]
+
+        tag_data = {
+            "data": {
+                "name": python_tag.name,
+                "slug": python_tag.slug,
+                "description": python_tag.description,
+                "usage_count": python_tag.usage_count,
+            }
+        }
+        tag_response = client.post("/api/v1/models/tag", json=tag_data)
+        assert tag_response.status_code == 200
+        tag_id = tag_response.json()["data"]["id"]
+
+        post_data = {
+            "data": {
+                "title": sample_post.title,
+                "slug": sample_post.slug,
+                "content": sample_post.content,
+                "status": sample_post.status.value,
+                "author_id": user_id,
+                "category_id": category_id,
+                "tags": [{"id": tag_id}],
+            }
+        }
+        create_response = client.post("/api/v1/models/post", json=post_data)
+        assert create_response.status_code == 200
+        created_post = create_response.json()["data"]
+
+        # Scalar relationships are serialized as one object
+        assert created_post["author"] == {
+            "id": user_id,
+            "username": "relationship_author",
+        }
+        assert created_post["category"] == {"id": category_id}
+        # Collections are serialized as a list
+        assert created_post["tags"] == [{"id": tag_id}]
+        assert created_post["comments"] is None
+
 
 class TestCommentCRUD:
     """Test CRUD operations for Comment model."""
@@ -24,6 +24,14 @@ def test_get_records(client):
     assert "page_size" in result
 
 
+def test_get_records_rejects_non_positive_pagination(client):
+    """Test page and page_size below 1 are rejected before querying."""
+    for query in ("page_size=0", "page=0", "page_size=-1"):
+        response = client.get(f"/api/v1/models/modeltest?{query}")
+
+        assert response.status_code == 422
+
+
 def test_update_record_not_found(client):
     """Test updating non-existent record."""
     update_data = {"data": {"name": "Updated Name"}, "form_id": "test_form_id"}
@@ -2,6 +2,34 @@
 End-to-end tests for the views API endpoints.
 """
 
+import pytest
+from sqlmodel import SQLModel
+
+from fp_admin.models.views import FormView
+from fp_admin.registry import view_registry
+
+
+class LateViewModel(SQLModel):
+    pass
+
+
+@pytest.fixture
+def isolated_view_registry():
+    """Let a test register views, then drop them again."""
+    saved = (
+        dict(view_registry._registry),
+        dict(view_registry._by_name),
+        dict(view_registry._forms_by_name),
+    )
+    yield view_registry
+    (
+        view_registry._registry,
+        view_registry._by_name,
+        view_registry._forms_by_name,
+    ) = saved
+    # Never reuse a version whose cached body includes the test's views
+    view_registry._version += 1
+
 
 class TestViewsAPI:
     """Test cases for views API endpoints."""
@@ -151,3 +179,27 @@ class TestViewsAPI:
             assert isinstance(field["readonly"], bool)
             assert isinstance(field["disabled"], bool)
             assert isinstance(field["is_primary_key"], bool)
+
+    def test_get_model_views_unknown_model_is_empty(self, client):
+        """Test unknown models get an empty list, before and after caching."""
+        for _ in range(2):
+            response = client.get("/api/v1/views/nonexistentmodel")
+            assert response.status_code == 200
+            assert response.json() == {"data": []}
+
+    def test_views_include_views_registered_after_first_request(
+        self, client, isolated_view_registry
+    ):
+        """Test cached view bodies are rebuilt when a view is registered."""
+        before = client.get("/api/v1/views/").json()["data"]
+        assert "lateviewmodel" not in before
+        assert client.get("/api/v1/views/lateviewmodel").json() == {"data": []}
+
+        isolated_view_registry.register(
+            LateViewModel, FormView(name="LateViewForm", model=LateViewModel)
+        )
+
+        after = client.get("/api/v1/views/").json()["data"]
+        assert [view["name"] for view in after["lateviewmodel"]] == ["LateViewForm"]
+        model_views = client.get("/api/v1/views/lateviewmodel").json()["data"]
+        assert [view["name"] for view in model_views] == ["LateViewForm"]
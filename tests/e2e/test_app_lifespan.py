@@ -0,0 +1,63 @@
+"""
+End-to-end tests for the database initialization done at app startup.
+"""
+
+from typing import Callable, Iterator
+
+import pytest
+from sqlalchemy import Column, Integer, Table, inspect
+from sqlmodel import SQLModel
+
+from fp_admin import FastAPIAdmin
+from fp_admin.core import db_manager
+
+
+async def _has_table(engine, name: str) -> bool:
+    async with engine.connect() as conn:
+        return await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(name))
+
+
+@pytest.fixture
+def late_table() -> Iterator[Callable[[], Table]]:
+    """Add a table to SQLModel's metadata, as importing a model module would.
+
+    The table is removed again on teardown so later `init_db()` calls do not
+    create it and the test can run again in the same process.
+    """
+    tables = []
+
+    def add() -> Table:
+        table = Table(
+            "late_imported_model",
+            SQLModel.metadata,
+            Column("id", Integer, primary_key=True),
+        )
+        tables.append(table)
+        return table
+
+    yield add
+    for table in tables:
+        SQLModel.metadata.remove(table)
+
+
+@pytest.mark.asyncio
+async def test_startup_creates_tables_of_models_imported_later(engine, late_table):
+    try:
+        app = FastAPIAdmin()
+        async with app.router.lifespan_context(app):
+            pass
+        assert db_manager.initialized
+
+        table = late_table()
+
+        assert not db_manager.initialized
+        assert not await _has_table(engine, table.name)
+
+        app = FastAPIAdmin()
+        async with app.router.lifespan_context(app):
+            pass
+        assert db_manager.initialized
+        assert await _has_table(engine, table.name)
+    finally:
+        # Let aiosqlite's worker thread stop even when an assertion fails
+        await engine.dispose()
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from fp_admin.admin.apps import AppInfo, apps_info, apps_info_json
+from fp_admin.admin.apps.app_info import _build_apps_info
+from fp_admin.registry import apps_registry, model_registry
+
+
+def test_apps_info_is_cached_between_calls():
+    first = apps_info()
+    hits = _build_apps_info.cache_info().hits
+
+    assert apps_info() == first
+    assert _build_apps_info.cache_info().hits == hits + 1
+
+
+def test_apps_info_cannot_be_changed_by_callers():
+    listing = apps_info()
+    assert isinstance(listing, tuple)
+
+    app = AppInfo(name="blog", label="Blog", models=[])
+    with pytest.raises(ValidationError):
+        app.label = "changed"  # type: ignore[misc]
+    assert app.models == ()
+
+
+def test_apps_info_rebuilt_after_registry_change(monkeypatch):
+    before = apps_info()
+    misses = _build_apps_info.cache_info().misses
+
+    monkeypatch.setattr(model_registry, "_version", model_registry.version + 1)
+    assert apps_info() == before
+    assert _build_apps_info.cache_info().misses == misses + 1
+
+    monkeypatch.setattr(apps_registry, "_version", apps_registry.version + 1)
+    assert apps_info() == before
+    assert _build_apps_info.cache_info().misses == misses + 2
+
+
+def test_apps_info_json_matches_apps_info():
+    assert apps_info_json() is apps_info_json()
+    assert json.loads(apps_info_json()) == [
+        app.model_dump(mode="json") for app in apps_info()
+    ]
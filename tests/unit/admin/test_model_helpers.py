@@ -0,0 +1,27 @@
+from fp_admin.admin.models import get_relationship_load_options
+from fp_admin.apps.auth.models import User, UserOAuthAccount
+
+
+def _loading_strategy(option):
+    return dict(option.context[0].strategy)["lazy"]
+
+
+def test_collections_are_selectin_loaded():
+    (option,) = get_relationship_load_options(User, ["groups"])
+
+    assert _loading_strategy(option) == "selectin"
+
+
+def test_scalar_relationships_are_joined():
+    (option,) = get_relationship_load_options(UserOAuthAccount, ["user"])
+
+    assert _loading_strategy(option) == "joined"
+
+
+def test_options_follow_requested_order():
+    options = get_relationship_load_options(User, ["oauth_accounts", "permissions"])
+
+    assert [str(option.path[1]) for option in options] == [
+        "User.oauth_accounts",
+        "User.permissions",
+    ]
@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from fp_admin.apps.auth.services import UserService, password_hasher, verify_password
+from fp_admin.exceptions import ServiceError
+
+
+@pytest.fixture(scope="module")
+def hashed_password():
+    return password_hasher.hash("correct-password")
+
+
+def test_verify_password_accepts_matching_password(hashed_password):
+    assert verify_password("correct-password", hashed_password) is True
+
+
+def test_verify_password_rejects_wrong_password(hashed_password):
+    assert verify_password("wrong-password", hashed_password) is False
+
+
+@pytest.mark.parametrize("hashed", ["", "not-a-hash", "$2b$12$legacybcrypthash"])
+def test_verify_password_rejects_malformed_hash(hashed):
+    assert verify_password("correct-password", hashed) is False
+
+
+class FailingSession:
+    async def exec(self, statement):
+        raise OperationalError(str(statement), {}, Exception("database is locked"))
+
+
+@pytest.mark.asyncio
+async def test_user_auth_func_wraps_database_errors():
+    service = UserService(FailingSession())  # type: ignore[arg-type]
+    with pytest.raises(ServiceError, match="Failed to load user admin"):
+        await service.user_auth_func("admin", "correct-password")
@@ -0,0 +1,8 @@
+from fp_admin.models.field import get_error_message
+
+
+def test_get_error_message_formats_template():
+    assert get_error_message("MIN_LENGTH", min_length=3) == (
+        "Field must be at least 3 characters"
+    )
+    assert get_error_message("UNKNOWN", field_name="Name") == ("Name validation failed")
@@ -88,6 +88,19 @@ def test_primary_key_flag_and_name():
     assert f.name == "id"
 
 
+def test_widget_variants_go_through_base_factories():
+    class CustomFactory(FieldFactory):
+        @classmethod
+        def boolean_field(cls, name, **kwargs):
+            kwargs.setdefault("help_text", "custom")
+            return super().boolean_field(name, **kwargs)
+
+    f = CustomFactory.toggle_field("active")
+    assert f.widget == "switch"
+    assert f.help_text == "custom"
+    assert FieldFactory.toggle_field("active", widget="Checkbox").widget == "Checkbox"
+
+
 # --- Validators & patterns ---------------------------------------------------
 
 
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from sqlmodel import Field, SQLModel
+
+from fp_admin.exceptions import ModelError
+from fp_admin.registry._model_registry import AdminModelRegistry
+
+
+class RegistryGadget(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+
+def _admin(model):
+    return SimpleNamespace(model=model, label=model.__name__, display_field=None)
+
+
+def test_get_by_model_class_finds_registered_model():
+    registry = AdminModelRegistry()
+    registry.register(_admin(RegistryGadget))
+
+    assert registry.get_by_model_class(RegistryGadget) is registry.get("registrygadget")
+
+
+def test_reregistering_a_name_evicts_the_previous_model_class():
+    registry = AdminModelRegistry()
+    registry.register(_admin(RegistryGadget))
+
+    # A different class registered under the same model name replaces it
+    Replacement = type(
+        "RegistryGadget",
+        (SQLModel,),
+        {
+            "__tablename__": "registry_gadget_replacement",
+            "__annotations__": {"id": Optional[int]},
+            "id": Field(default=None, primary_key=True),
+        },
+        table=True,
+    )
+    registry.register(_admin(Replacement))
+
+    assert registry.get_by_model_class(Replacement) is registry.get("registrygadget")
+    with pytest.raises(ModelError):
+        registry.get_by_model_class(RegistryGadget)
@@ -0,0 +1,32 @@
+import pytest
+from sqlmodel import SQLModel
+
+from fp_admin.models.views import FormView, ListView
+from fp_admin.registry._view_registry import ViewNotFound, ViewRegistry
+
+
+class RegistryWidget(SQLModel):
+    pass
+
+
+def test_find_by_name_keeps_the_first_registered_view():
+    registry = ViewRegistry()
+    first = FormView(name="WidgetForm", model=RegistryWidget)
+    second = FormView(name="WidgetForm", model=RegistryWidget)
+    registry.register(RegistryWidget, first)
+    registry.register(RegistryWidget, second)
+
+    assert registry.find_by_name("WidgetForm") is first
+    assert registry.get_form_view("WidgetForm") is first
+    # Both views are still listed for the model
+    assert registry.get("registrywidget") == [first, second]
+
+
+def test_get_form_view_ignores_list_views():
+    registry = ViewRegistry()
+    list_view = ListView(name="WidgetList", view_type="list", model=RegistryWidget)
+    registry.register(RegistryWidget, list_view)
+
+    assert registry.find_by_name("WidgetList") is list_view
+    with pytest.raises(ViewNotFound):
+        registry.get_form_view("WidgetList")
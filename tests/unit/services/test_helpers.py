@@ -0,0 +1,8 @@
+import pytest
+
+from fp_admin.services.v1.helpers import lookup_form_id
+
+
+def test_lookup_form_id_without_forms_fails_for_unknown_mode():
+    with pytest.raises(ValueError, match="Failed to load form for: nosuchmodel"):
+        lookup_form_id(["title"], "nosuchmodel", "delete")  # type: ignore[arg-type]
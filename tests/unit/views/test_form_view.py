@@ -0,0 +1,50 @@
+import pytest
+from sqlmodel import SQLModel
+
+from fp_admin.models.field import FieldFactory
+from fp_admin.models.views import FormView
+from fp_admin.models.views.exceptions import FpValidationErrors
+
+
+class FormWidget(SQLModel):
+    pass
+
+
+@pytest.fixture
+def form_view():
+    return FormView(
+        name="FormWidgetForm",
+        model=FormWidget,
+        fields=[
+            FieldFactory.string_field("title"),
+            FieldFactory.number_field("quantity"),
+        ],
+        creation_fields=["title", "quantity"],
+    )
+
+
+def test_get_form_model_is_built_once_per_field_set(form_view):
+    model = form_view.get_form_model(["title", "quantity"])
+
+    assert model is not None
+    assert form_view.get_form_model(["title", "quantity"]) is model
+    assert form_view.get_form_model(["title"]) is not model
+
+
+def test_validate_fields_raises_on_invalid_data(form_view):
+    form_view.validate_create_fields({"title": "Widget", "quantity": 3})
+
+    for _ in range(2):
+        with pytest.raises(FpValidationErrors) as exc_info:
+            form_view.validate_create_fields({"title": "Widget", "quantity": "many"})
+        assert [d.field_name for d in exc_info.value.details] == ["quantity"]
+
+
+def test_get_form_model_rebuilt_after_fields_change(form_view):
+    model = form_view.get_form_model(["title", "quantity"])
+
+    form_view.fields[1] = FieldFactory.string_field("quantity")
+    rebuilt = form_view.get_form_model(["title", "quantity"])
+
+    assert rebuilt is not model
+    rebuilt.model_validate({"title": "Widget", "quantity": "many"})